@@ -1,7 +1,10 @@
 #[cfg(all(target_os = "macos", target_arch = "aarch64"))]
 use crate::apple_intelligence;
 use crate::audio_feedback::{play_feedback_sound, play_feedback_sound_blocking, SoundType};
-use crate::audio_toolkit::{is_microphone_access_denied, is_no_input_device_error, VadPolicy};
+use crate::audio_toolkit::{
+    constants::{SHORT_CLIP_PAD_SAMPLES, SILENCE_TRIM_DB},
+    is_microphone_access_denied, is_no_input_device_error, silence_trim_range, VadPolicy,
+};
 use crate::managers::audio::AudioRecordingManager;
 use crate::managers::history::HistoryManager;
 use crate::managers::model::ModelManager;
@@ -118,6 +121,27 @@ fn should_use_streaming_overlay(style: OverlayStyle, is_streaming: bool) -> bool
     style == OverlayStyle::Live && is_streaming
 }
 
+/// The part of a recording handed to batch transcription. With VAD off and
+/// `trim_silence` on, silent edges are cut so they don't cost encoder time.
+/// Only this borrowed slice is trimmed; the recording itself (saved WAV,
+/// history retries) is left whole. The floor is the short-clip pad length, so
+/// a padded clip is never cut back below it.
+fn batch_audio<'a>(app: &AppHandle, samples: &'a [f32]) -> &'a [f32] {
+    let settings = get_settings(app);
+    if !settings.trim_silence || settings.vad_enabled {
+        return samples;
+    }
+    let keep = silence_trim_range(samples, SILENCE_TRIM_DB, SHORT_CLIP_PAD_SAMPLES);
+    if keep.len() != samples.len() {
+        debug!(
+            "Trimmed silence: {} -> {} samples",
+            samples.len(),
+            keep.len()
+        );
+    }
+    &samples[keep]
+}
+
 async fn post_process_transcription(settings: &AppSettings, transcription: &str) -> Option<String> {
     if is_blank_transcription(transcription) {
         debug!("Post-processing skipped because the transcription is empty");
@@ -683,12 +707,15 @@ impl ShortcutAction for TranscribeAction {
                     utils::hide_recording_overlay(&ah);
                     change_tray_icon(&ah, TrayIconState::Idle);
                 } else {
-                    // Save WAV concurrently with transcription
+                    // Save WAV concurrently with transcription. Both read the same
+                    // recording buffer through an Arc rather than a full copy, and
+                    // the transcriber is fed from memory — never from the WAV.
                     let sample_count = samples.len();
+                    let samples = Arc::new(samples);
                     let file_name = format!("handy-{}.wav", chrono::Utc::now().timestamp());
                     let wav_path = hm.recordings_dir().join(&file_name);
                     let wav_path_for_verify = wav_path.clone();
-                    let samples_for_wav = samples.clone();
+                    let samples_for_wav = Arc::clone(&samples);
                     let wav_handle = tauri::async_runtime::spawn_blocking(move || {
                         crate::audio_toolkit::save_wav_file(&wav_path, &samples_for_wav)
                     });
@@ -705,7 +732,7 @@ impl ShortcutAction for TranscribeAction {
                         // surfaced instead — the worker may still hold the engine,
                         // so a batch fallback would contend with it.
                         Ok(Some(text)) if !text.trim().is_empty() => Ok(text),
-                        Ok(_) => tm.transcribe(samples),
+                        Ok(_) => tm.transcribe(batch_audio(&ah, &samples)),
                         Err(err) => Err(err),
                     };
 
@@ -9,6 +9,8 @@ pub use device::{list_input_devices, list_output_devices, CpalDeviceInfo};
 pub use recorder::{
     is_microphone_access_denied, is_no_input_device_error, AudioRecorder, VadPolicy,
 };
-pub use resampler::FrameResampler;
-pub use utils::{read_wav_samples, save_wav_file, verify_wav_file};
+pub use resampler::{resample_clip, FrameResampler};
+pub use utils::{
+    decode_wav_samples, read_wav_samples, save_wav_file, silence_trim_range, verify_wav_file,
+};
 pub use visualizer::AudioVisualiser;
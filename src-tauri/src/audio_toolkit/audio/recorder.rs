@@ -407,7 +407,6 @@ impl AudioRecorder {
         T: Sample + SizedSample + Send + 'static,
         f32: cpal::FromSample<T>,
     {
-        let mut output_buffer = Vec::new();
         let mut eos_sent = false;
         // Resolve the effective channel to use. If the selected channel is
         // out of range for this device, fall back to averaging all channels.
@@ -427,35 +426,30 @@ impl AudioRecorder {
             }
             eos_sent = false;
 
-            output_buffer.clear();
+            // Downmix straight into the Vec that crosses the channel: it is
+            // moved to the consumer, not copied out of a reused scratch buffer.
+            let frame_count = data.len() / channels;
+            let mut output_buffer = Vec::with_capacity(frame_count);
 
             if channels == 1 {
                 output_buffer.extend(data.iter().map(|&sample| sample.to_sample::<f32>()));
+            } else if let Some(ch) = use_channel {
+                for frame in data.chunks_exact(channels) {
+                    let mono_sample = frame[ch].to_sample::<f32>();
+                    output_buffer.push(mono_sample);
+                }
             } else {
-                let frame_count = data.len() / channels;
-                output_buffer.reserve(frame_count);
-
-                if let Some(ch) = use_channel {
-                    for frame in data.chunks_exact(channels) {
-                        let mono_sample = frame[ch].to_sample::<f32>();
-                        output_buffer.push(mono_sample);
-                    }
-                } else {
-                    for frame in data.chunks_exact(channels) {
-                        let mono_sample = frame
-                            .iter()
-                            .map(|&sample| sample.to_sample::<f32>())
-                            .sum::<f32>()
-                            / channels as f32;
-                        output_buffer.push(mono_sample);
-                    }
+                for frame in data.chunks_exact(channels) {
+                    let mono_sample = frame
+                        .iter()
+                        .map(|&sample| sample.to_sample::<f32>())
+                        .sum::<f32>()
+                        / channels as f32;
+                    output_buffer.push(mono_sample);
                 }
             }
 
-            if sample_tx
-                .send(AudioChunk::Samples(output_buffer.clone()))
-                .is_err()
-            {
+            if sample_tx.send(AudioChunk::Samples(output_buffer)).is_err() {
                 log::error!("Failed to send samples");
             }
         };
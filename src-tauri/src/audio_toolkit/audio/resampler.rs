@@ -114,6 +114,20 @@ impl FrameResampler {
     }
 }
 
+/// Resample a complete clip in one pass, e.g. a WAV file recorded at a rate
+/// other than the model's. Returns the input untouched when the rates match.
+pub fn resample_clip(samples: Vec<f32>, in_hz: usize, out_hz: usize) -> Vec<f32> {
+    if in_hz == out_hz {
+        return samples;
+    }
+
+    let mut resampler = FrameResampler::new(in_hz, out_hz, Duration::from_millis(30));
+    let mut out = Vec::with_capacity(samples.len() * out_hz / in_hz + resampler.frame_samples);
+    resampler.push(&samples, |frame| out.extend_from_slice(frame));
+    resampler.finish(|frame| out.extend_from_slice(frame));
+    out
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -242,6 +256,25 @@ mod tests {
         }
     }
 
+    #[test]
+    fn resample_clip_passthrough_returns_input() {
+        let clip = vec![0.25f32; 1000];
+        assert_eq!(resample_clip(clip.clone(), 16000, 16000), clip);
+    }
+
+    #[test]
+    fn resample_clip_converts_length() {
+        // 1 s at 44.1 kHz -> ~1 s at 16 kHz. finish() pads the last chunk
+        // and frame, and the FFT blocks don't align to the clip, so allow 10%.
+        let sine = sine_wave(44100, 440.0, 1.0);
+        let out = resample_clip(sine, 44100, 16000);
+        assert!(
+            out.len().abs_diff(16000) < 1600,
+            "unexpected resampled length {}",
+            out.len()
+        );
+    }
+
     #[test]
     fn finish_does_not_leak_tail_into_next_session() {
         // 48kHz -> 16kHz, 30ms frames (480 output samples per frame).
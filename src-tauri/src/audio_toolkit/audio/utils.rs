@@ -1,11 +1,18 @@
 use anyhow::Result;
 use hound::{WavReader, WavSpec, WavWriter};
 use log::debug;
+use std::io::Read;
+use std::ops::Range;
 use std::path::Path;
 
 /// Read a WAV file and return normalised f32 samples.
 pub fn read_wav_samples<P: AsRef<Path>>(file_path: P) -> Result<Vec<f32>> {
-    let reader = WavReader::open(file_path.as_ref())?;
+    decode_wav_samples(WavReader::open(file_path.as_ref())?)
+}
+
+/// Decode an already-open WAV's 16-bit samples to normalised f32, so a caller
+/// that checked `reader.spec()` first doesn't have to open the file again.
+pub fn decode_wav_samples<R: Read>(reader: WavReader<R>) -> Result<Vec<f32>> {
     let samples = reader
         .into_samples::<i16>()
         .map(|s| s.map(|v| v as f32 / i16::MAX as f32))
@@ -27,6 +34,42 @@ pub fn verify_wav_file<P: AsRef<Path>>(file_path: P, expected_samples: usize) ->
     Ok(())
 }
 
+/// Frame length for [`silence_trim_range`]: 20 ms at 16 kHz.
+const TRIM_FRAME_SAMPLES: usize = 320;
+/// Quiet frames kept on each side of the detected speech (200 ms), so soft
+/// onsets and trailing consonants under the threshold are not clipped.
+const TRIM_PAD_FRAMES: usize = 10;
+
+/// The span of 16 kHz audio left after cutting leading and trailing silence.
+/// A 20 ms frame counts as silent when its RMS is below `threshold_db` dBFS.
+/// The span is widened to at least `min_samples` (within the clip), since
+/// whisper-family models won't transcribe inputs under a second. Returns the
+/// whole clip when no frame clears the threshold, so a quiet recording is
+/// still transcribed rather than dropped.
+pub fn silence_trim_range(samples: &[f32], threshold_db: f32, min_samples: usize) -> Range<usize> {
+    let threshold = 10f32.powf(threshold_db / 20.0);
+    let min_mean_square = threshold * threshold;
+    let is_loud = |frame: &[f32]| {
+        frame.iter().map(|s| s * s).sum::<f32>() / frame.len() as f32 >= min_mean_square
+    };
+
+    let frames = samples.chunks(TRIM_FRAME_SAMPLES);
+    let frame_count = frames.len();
+    let Some(first) = frames.clone().position(is_loud) else {
+        return 0..samples.len();
+    };
+    let last = frame_count - 1 - frames.rev().position(is_loud).unwrap_or(0);
+
+    let mut start = first.saturating_sub(TRIM_PAD_FRAMES) * TRIM_FRAME_SAMPLES;
+    let mut end = ((last + 1 + TRIM_PAD_FRAMES) * TRIM_FRAME_SAMPLES).min(samples.len());
+    if end - start < min_samples {
+        // Grow forward first (keeps the onset where it is), then back.
+        end = (start + min_samples).min(samples.len());
+        start = end.saturating_sub(min_samples);
+    }
+    start..end
+}
+
 /// Save audio samples as a WAV file
 pub fn save_wav_file<P: AsRef<Path>>(file_path: P, samples: &[f32]) -> Result<()> {
     let spec = WavSpec {
@@ -38,13 +81,74 @@ pub fn save_wav_file<P: AsRef<Path>>(file_path: P, samples: &[f32]) -> Result<()
 
     let mut writer = WavWriter::create(file_path.as_ref(), spec)?;
 
-    // Convert f32 samples to i16 for WAV
+    // Convert f32 samples to i16 for WAV. hound's 16-bit writer narrows into
+    // one preallocated buffer and writes it in a single call, instead of a
+    // format-checked write per sample.
+    let mut sample_writer = writer.get_i16_writer(samples.len() as u32);
     for sample in samples {
-        let sample_i16 = (sample * i16::MAX as f32) as i16;
-        writer.write_sample(sample_i16)?;
+        sample_writer.write_sample((sample * i16::MAX as f32) as i16);
     }
+    sample_writer.flush()?;
 
     writer.finalize()?;
     debug!("Saved WAV file: {:?}", file_path.as_ref());
     Ok(())
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    const SECOND: usize = 16_000;
+
+    fn clip(silence_before: usize, speech: usize, silence_after: usize) -> Vec<f32> {
+        let mut samples = vec![0.0f32; silence_before];
+        samples.extend((0..speech).map(|i| if i % 2 == 0 { 0.3 } else { -0.3 }));
+        samples.resize(samples.len() + silence_after, 0.0);
+        samples
+    }
+
+    #[test]
+    fn trim_silence_keeps_speech_plus_padding() {
+        let samples = clip(2 * SECOND, SECOND, 3 * SECOND);
+        let trimmed = &samples[silence_trim_range(&samples, -40.0, 0)];
+
+        let pad = TRIM_PAD_FRAMES * TRIM_FRAME_SAMPLES;
+        assert_eq!(trimmed.len(), SECOND + 2 * pad);
+        assert!(trimmed[pad..pad + SECOND].iter().all(|s| s.abs() == 0.3));
+    }
+
+    #[test]
+    fn trim_silence_returns_all_silent_clip_unchanged() {
+        let samples = vec![0.001f32; SECOND];
+        assert_eq!(silence_trim_range(&samples, -40.0, 0).len(), samples.len());
+    }
+
+    #[test]
+    fn trim_silence_clamps_padding_to_clip_edges() {
+        let samples = clip(100, SECOND, 100);
+        assert_eq!(silence_trim_range(&samples, -40.0, 0).len(), samples.len());
+    }
+
+    #[test]
+    fn trim_silence_keeps_sub_second_clip_at_min_length() {
+        // A 0.3 s "yes" inside 2 s of silence: speech + padding is well under
+        // a second, so the span grows forward to the floor, onset included.
+        let speech = 3 * SECOND / 10;
+        let samples = clip(SECOND / 2, speech, 3 * SECOND / 2);
+        let range = silence_trim_range(&samples, -40.0, SECOND);
+
+        assert_eq!(range.len(), SECOND);
+        assert!(range.start <= SECOND / 2);
+        assert!(range.end >= SECOND / 2 + speech);
+    }
+
+    #[test]
+    fn trim_silence_min_length_grows_backward_at_clip_end() {
+        let speech = 3 * SECOND / 10;
+        let samples = clip(2 * SECOND, speech, 0);
+        let range = silence_trim_range(&samples, -40.0, SECOND);
+
+        assert_eq!(range, samples.len() - SECOND..samples.len());
+    }
+}
@@ -115,18 +115,21 @@ impl AudioVisualiser {
                 continue;
             }
 
-            // Calculate average power in this frequency range
-            let mut power_sum = 0.0;
-            for bin_idx in start_bin..end_bin {
-                let magnitude = self.fft_input[bin_idx].norm();
-                power_sum += magnitude * magnitude;
-            }
+            // Calculate average power in this frequency range. Power is the
+            // squared magnitude, so take it directly rather than sqrt-ing in
+            // norm() and squaring back.
+            let power_sum: f32 = self.fft_input[start_bin..end_bin]
+                .iter()
+                .map(|bin| bin.norm_sqr())
+                .sum();
 
             let avg_power = power_sum / (end_bin - start_bin) as f32;
 
-            // Convert to dB with proper scaling
+            // Convert to dB with proper scaling. Stays in the power domain:
+            // 10·log10(P / N²) == 20·log10(√P / N), without the square root.
             let db = if avg_power > 1e-12 {
-                20.0 * (avg_power.sqrt() / self.window_size as f32).log10()
+                let window_size = self.window_size as f32;
+                10.0 * (avg_power / (window_size * window_size)).log10()
             } else {
                 -80.0 // Very low floor for zero power
             };
@@ -1 +1,7 @@
 pub const WHISPER_SAMPLE_RATE: u32 = 16000;
+/// Length that recordings shorter than a second are zero-padded to, since
+/// whisper-family models won't transcribe inputs under a second.
+pub const SHORT_CLIP_PAD_SAMPLES: usize = WHISPER_SAMPLE_RATE as usize * 5 / 4;
+/// Frames quieter than this (RMS, dBFS) at either end of a VAD-off clip are
+/// trimmed before batch transcription, when `trim_silence` is enabled.
+pub const SILENCE_TRIM_DB: f32 = -40.0;
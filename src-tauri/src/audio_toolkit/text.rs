@@ -1,6 +1,9 @@
 use natural::phonetics::soundex;
 use once_cell::sync::Lazy;
 use regex::Regex;
+use std::borrow::Cow;
+use std::collections::HashMap;
+use std::sync::{Arc, Mutex};
 use strsim::levenshtein;
 
 /// Builds an n-gram string by cleaning and concatenating words
@@ -8,18 +11,26 @@ use strsim::levenshtein;
 /// Strips punctuation from each word, lowercases, and joins without spaces.
 /// This allows matching "Charge B" against "ChargeBee".
 fn build_ngram(words: &[&str]) -> String {
-    words
-        .iter()
-        .map(|w| build_match_key(w))
-        .collect::<Vec<_>>()
-        .concat()
+    let mut ngram = String::new();
+    for word in words {
+        push_match_key(&mut ngram, word);
+    }
+    ngram
 }
 
 fn build_match_key(word: &str) -> String {
-    word.chars()
-        .filter(|c| c.is_alphanumeric())
-        .flat_map(|c| c.to_lowercase())
-        .collect()
+    let mut key = String::new();
+    push_match_key(&mut key, word);
+    key
+}
+
+/// Appends `word`'s match key (alphanumerics only, lowercased) to `out`.
+fn push_match_key(out: &mut String, word: &str) {
+    out.extend(
+        word.chars()
+            .filter(|c| c.is_alphanumeric())
+            .flat_map(|c| c.to_lowercase()),
+    );
 }
 
 struct CustomWordMatchKey {
@@ -302,6 +313,64 @@ fn get_filler_words_for_language(lang: &str) -> &'static [&'static str] {
 
 static MULTI_SPACE_PATTERN: Lazy<Regex> = Lazy::new(|| Regex::new(r"\s{2,}").unwrap());
 
+/// A compiled filler word list, shared between the cache and its callers.
+type FillerPatterns = Arc<[Regex]>;
+
+/// Compiled default filler patterns, keyed by the static word list they were
+/// built from, so each language's list is compiled once per process rather
+/// than on every transcription. Languages sharing a list share one entry.
+static DEFAULT_FILLER_PATTERNS: Lazy<Mutex<HashMap<&'static [&'static str], FillerPatterns>>> =
+    Lazy::new(|| Mutex::new(HashMap::new()));
+
+/// A custom filler word list and the patterns compiled from it.
+struct CustomFillerPatterns {
+    words: Vec<String>,
+    patterns: FillerPatterns,
+}
+
+/// The most recent custom filler list and its compiled patterns. The list
+/// only changes when the user edits it, so one entry is enough to stop every
+/// transcription from recompiling the same regexes.
+static CUSTOM_FILLER_PATTERNS: Lazy<Mutex<Option<CustomFillerPatterns>>> =
+    Lazy::new(|| Mutex::new(None));
+
+fn filler_pattern(word: &str) -> Result<Regex, regex::Error> {
+    Regex::new(&format!(r"(?i)\b{}\b[,.]?", regex::escape(word)))
+}
+
+fn default_filler_patterns(lang: &str) -> FillerPatterns {
+    let words = get_filler_words_for_language(lang);
+    let mut cache = DEFAULT_FILLER_PATTERNS.lock().unwrap();
+    cache
+        .entry(words)
+        .or_insert_with(|| {
+            words
+                .iter()
+                .map(|word| filler_pattern(word).unwrap())
+                .collect()
+        })
+        .clone()
+}
+
+fn custom_filler_patterns(words: &[String]) -> FillerPatterns {
+    let mut cache = CUSTOM_FILLER_PATTERNS.lock().unwrap();
+    if let Some(cached) = cache.as_ref() {
+        if cached.words.as_slice() == words {
+            return cached.patterns.clone();
+        }
+    }
+
+    let patterns: FillerPatterns = words
+        .iter()
+        .filter_map(|word| filler_pattern(word).ok())
+        .collect();
+    *cache = Some(CustomFillerPatterns {
+        words: words.to_vec(),
+        patterns: patterns.clone(),
+    });
+    patterns
+}
+
 /// Collapses repeated words (3+ repetitions) to a single instance.
 /// E.g., "wh wh wh wh" -> "wh", "I I I I" -> "I"
 fn collapse_stutters(text: &str) -> String {
@@ -364,20 +433,18 @@ pub fn filter_transcription_output(
     let mut filtered = text.to_string();
 
     // Build filler patterns from custom list or language defaults
-    let patterns: Vec<Regex> = match custom_filler_words {
-        Some(words) => words
-            .iter()
-            .filter_map(|word| Regex::new(&format!(r"(?i)\b{}\b[,.]?", regex::escape(word))).ok())
-            .collect(),
-        None => get_filler_words_for_language(lang)
-            .iter()
-            .map(|word| Regex::new(&format!(r"(?i)\b{}\b[,.]?", regex::escape(word))).unwrap())
-            .collect(),
+    let patterns = match custom_filler_words {
+        Some(words) => custom_filler_patterns(words),
+        None => default_filler_patterns(lang),
     };
 
     // Remove filler words
-    for pattern in &patterns {
-        filtered = pattern.replace_all(&filtered, "").to_string();
+    // replace_all borrows when nothing matches, and most patterns don't match
+    // most transcripts; only reallocate when a filler was actually removed.
+    for pattern in patterns.iter() {
+        if let Cow::Owned(replaced) = pattern.replace_all(&filtered, "") {
+            filtered = replaced;
+        }
     }
 
     // Collapse repeated 1-2 letter words (stutter artifacts like "wh wh wh wh")
@@ -562,6 +629,15 @@ mod tests {
         assert_eq!(result, "so I think this works");
     }
 
+    #[test]
+    fn test_filter_custom_filler_words_picks_up_edits() {
+        let text = "okay so right";
+        let first = Some(vec!["okay".to_string()]);
+        assert_eq!(filter_transcription_output(text, "en", &first), "so right");
+        let edited = Some(vec!["right".to_string()]);
+        assert_eq!(filter_transcription_output(text, "en", &edited), "okay so");
+    }
+
     #[test]
     fn test_filter_custom_filler_words_empty_disables() {
         let custom = Some(vec![]);
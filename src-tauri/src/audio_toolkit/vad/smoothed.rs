@@ -39,11 +39,17 @@ impl SmoothedVad {
 
 impl VoiceActivityDetector for SmoothedVad {
     fn push_frame<'a>(&'a mut self, frame: &'a [f32]) -> Result<VadFrame<'a>> {
-        // 1. Buffer every incoming frame for possible pre-roll
-        self.frame_buffer.push_back(frame.to_vec());
-        while self.frame_buffer.len() > self.prefill_frames + 1 {
-            self.frame_buffer.pop_front();
-        }
+        // 1. Buffer every incoming frame for possible pre-roll. Once the ring
+        //    is full, the evicted frame's allocation is reused for the new one
+        //    instead of allocating per frame for the whole recording.
+        let mut slot = if self.frame_buffer.len() > self.prefill_frames {
+            self.frame_buffer.pop_front().unwrap_or_default()
+        } else {
+            Vec::with_capacity(frame.len())
+        };
+        slot.clear();
+        slot.extend_from_slice(frame);
+        self.frame_buffer.push_back(slot);
 
         // 2. Delegate to the wrapped boolean VAD
         let is_voice = self.inner_vad.is_voice(frame)?;
@@ -108,3 +114,43 @@ impl VoiceActivityDetector for SmoothedVad {
         self.temp_out.clear();
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    /// Inner VAD that reports voice for any frame whose first sample is > 0.
+    struct SignVad;
+
+    impl VoiceActivityDetector for SignVad {
+        fn push_frame<'a>(&'a mut self, frame: &'a [f32]) -> Result<VadFrame<'a>> {
+            if frame[0] > 0.0 {
+                Ok(VadFrame::Speech(frame))
+            } else {
+                Ok(VadFrame::Noise)
+            }
+        }
+    }
+
+    #[test]
+    fn onset_emits_prefill_in_order_after_ring_wraps() {
+        let mut vad = SmoothedVad::new(Box::new(SignVad), 2, 0, 1);
+
+        // Enough silent frames to cycle the pre-roll ring several times.
+        for i in 0..10 {
+            let frame = [-(i as f32) - 1.0; 4];
+            assert!(matches!(vad.push_frame(&frame).unwrap(), VadFrame::Noise));
+        }
+
+        let onset = [1.0f32; 4];
+        match vad.push_frame(&onset).unwrap() {
+            VadFrame::Speech(samples) => {
+                let mut expected = vec![-9.0f32; 4];
+                expected.extend([-10.0f32; 4]);
+                expected.extend(onset);
+                assert_eq!(samples, expected.as_slice());
+            }
+            VadFrame::Noise => panic!("expected speech on onset"),
+        }
+    }
+}
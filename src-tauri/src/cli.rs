@@ -28,9 +28,10 @@ pub struct CliArgs {
     #[arg(long)]
     pub debug: bool,
 
-    /// Transcribe this WAV (16 kHz mono) headlessly and exit. Runs the same
-    /// batch transcription path as the app — no mic, no VAD, no download
-    /// (the model must already be installed).
+    /// Transcribe this WAV (mono 16-bit PCM, any rate) headlessly and exit.
+    /// Runs the same batch transcription path as the app — no mic, no VAD, no
+    /// download (the model must already be installed). The reported load time
+    /// includes the one-off GPU warm-up run, when the model gets one.
     #[arg(short = 'f', long, value_name = "WAV")]
     pub transcribe_file: Option<PathBuf>,
 
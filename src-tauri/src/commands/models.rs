@@ -126,8 +126,12 @@ pub fn switch_active_model(app: &AppHandle, model_id: &str) -> Result<(), String
     write_settings(app, settings);
 
     // Skip eager loading if unload is set to "Immediately" — the model
-    // will be loaded on-demand during the next transcription.
-    if unload_timeout == ModelUnloadTimeout::Immediately {
+    // will be loaded on-demand during the next transcription. Likewise,
+    // re-selecting the model that is already loaded (tray re-click,
+    // onboarding finishing on the current model) would drop and rebuild the
+    // same engine, so keep it and just confirm the selection.
+    let load_on_demand = unload_timeout == ModelUnloadTimeout::Immediately;
+    if load_on_demand || transcription_manager.is_model_resident(model_id) {
         // Notify frontend — load_model won't be called so no events
         // would otherwise be emitted.
         let _ = app.emit(
@@ -139,15 +143,19 @@ pub fn switch_active_model(app: &AppHandle, model_id: &str) -> Result<(), String
                 error: None,
             },
         );
-        log::info!(
-            "Model selection changed to {} (not loading — unload set to Immediately).",
-            model_id
-        );
+        if load_on_demand {
+            log::info!(
+                "Model selection changed to {} (not loading — unload set to Immediately).",
+                model_id
+            );
+        } else {
+            log::info!("Model {} is already loaded; keeping it.", model_id);
+        }
         return Ok(());
     }
 
     // Load the model. On failure, revert the persisted selection.
-    if let Err(e) = transcription_manager.load_model(model_id) {
+    if let Err(e) = transcription_manager.preload_model(model_id) {
         let mut settings = get_settings(app);
         settings.selected_model = old_model;
         settings.onboarding_completed = old_onboarding_completed;
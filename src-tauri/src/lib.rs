@@ -394,11 +394,28 @@ mod headless_guard_tests {
     }
 }
 
+/// `--transcribe-file --json` result. Borrows the run's values and is
+/// serialized straight into stdout, with no intermediate `serde_json::Value`.
+#[derive(serde::Serialize)]
+struct TranscribeFileReport<'a> {
+    model: &'a str,
+    requested_device: &'a str,
+    bound_backend: Option<&'a str>,
+    audio_secs: f64,
+    /// Includes the GPU warm-up run, if the load did one.
+    load_ms: u64,
+    transcribe_ms: &'a [u64],
+    best_ms: u64,
+    rtf: f64,
+    text: &'a str,
+}
+
 /// Headless one-shot transcription for the `--transcribe-file` / `--list-devices`
 /// path. Drives the same `TranscriptionManager::transcribe` the app uses; no
 /// mic, no VAD, no download. Returns a process exit code (0 ok, 1 runtime
 /// failure, 2 bad input/usage).
 fn run_headless_transcription(app: &AppHandle, args: &CliArgs) -> i32 {
+    use std::io::Write;
     use std::time::Instant;
 
     // --list-devices: print registered compute devices (with indices) and exit.
@@ -463,38 +480,46 @@ fn run_headless_transcription(app: &AppHandle, args: &CliArgs) -> i32 {
         return 0;
     };
 
-    // read_wav_samples reads 16-bit int samples and does no validation; the app
-    // only ever saves 16 kHz mono 16-bit PCM, so reject anything else rather than
-    // transcribe garbage / mis-time / mis-decode.
-    match hound::WavReader::open(&wav) {
-        Ok(reader) => {
-            let spec = reader.spec();
-            if spec.sample_rate != 16_000
-                || spec.channels != 1
-                || spec.bits_per_sample != 16
-                || spec.sample_format != hound::SampleFormat::Int
-            {
-                eprintln!(
-                    "error: expected 16 kHz mono 16-bit PCM WAV, got {} Hz / {} ch / {}-bit {:?}",
-                    spec.sample_rate, spec.channels, spec.bits_per_sample, spec.sample_format
-                );
-                return 2;
-            }
-        }
+    // Open once: check the header, then decode from the same reader.
+    // decode_wav_samples reads 16-bit int samples and does no validation, so
+    // reject anything but mono 16-bit PCM rather than transcribe garbage /
+    // mis-decode. Other sample rates are resampled to 16 kHz below.
+    let reader = match hound::WavReader::open(&wav) {
+        Ok(reader) => reader,
         Err(e) => {
             eprintln!("error: cannot open {}: {}", wav.display(), e);
             return 2;
         }
+    };
+    let spec = reader.spec();
+    if spec.channels != 1
+        || spec.bits_per_sample != 16
+        || spec.sample_format != hound::SampleFormat::Int
+    {
+        eprintln!(
+            "error: expected mono 16-bit PCM WAV, got {} Hz / {} ch / {}-bit {:?}",
+            spec.sample_rate, spec.channels, spec.bits_per_sample, spec.sample_format
+        );
+        return 2;
     }
+    let sample_rate = spec.sample_rate;
 
-    let samples = match crate::audio_toolkit::read_wav_samples(&wav) {
+    let samples = match crate::audio_toolkit::audio::decode_wav_samples(reader) {
         Ok(s) => s,
         Err(e) => {
             eprintln!("error: failed to read {}: {}", wav.display(), e);
             return 2;
         }
     };
-    let audio_secs = samples.len() as f64 / 16_000.0;
+    // Resample once up front, outside the timed runs, so every --repeat
+    // iteration transcribes the same 16 kHz buffer.
+    let whisper_rate = crate::audio_toolkit::constants::WHISPER_SAMPLE_RATE;
+    let samples = crate::audio_toolkit::audio::resample_clip(
+        samples,
+        sample_rate as usize,
+        whisper_rate as usize,
+    );
+    let audio_secs = samples.len() as f64 / f64::from(whisper_rate);
 
     let tm = app.state::<Arc<TranscriptionManager>>();
 
@@ -516,9 +541,11 @@ fn run_headless_transcription(app: &AppHandle, args: &CliArgs) -> i32 {
         None => "settings".to_string(),
     };
 
-    // Cold load (timed).
+    // Cold load (timed). On a GPU backend this includes the warm-up run (see
+    // load_model_with_device), so load_ms covers everything before the first
+    // transcription runs hot, unless unload is set to Immediately.
     let load_start = Instant::now();
-    if let Err(e) = tm.load_model_with_device(&model_id, device_index) {
+    if let Err(e) = tm.load_model_with_device(&model_id, device_index, true) {
         eprintln!("error: load_model('{}') failed: {}", model_id, e);
         return 1;
     }
@@ -533,13 +560,13 @@ fn run_headless_transcription(app: &AppHandle, args: &CliArgs) -> i32 {
         // the engine after each run; reload (untimed) so repeats keep working
         // and the inference timing below stays clean.
         if !tm.is_model_loaded() {
-            if let Err(e) = tm.load_model_with_device(&model_id, device_index) {
+            if let Err(e) = tm.load_model_with_device(&model_id, device_index, false) {
                 eprintln!("error: reload before run {} failed: {}", i + 1, e);
                 return 1;
             }
         }
         let t = Instant::now();
-        match tm.transcribe(samples.clone()) {
+        match tm.transcribe(&samples) {
             Ok(out) => text = out,
             Err(e) => {
                 eprintln!("error: transcribe failed: {}", e);
@@ -555,33 +582,46 @@ fn run_headless_transcription(app: &AppHandle, args: &CliArgs) -> i32 {
         0.0
     };
 
+    // One stdout lock and one explicit flush for the whole result, rather than
+    // a lock + line-buffered write per println!.
+    let mut stdout = std::io::BufWriter::new(std::io::stdout().lock());
     if args.json {
-        println!(
-            "{}",
-            serde_json::json!({
-                "model": model_id,
-                "requested_device": requested_device,
-                "bound_backend": bound_backend,
-                "audio_secs": audio_secs,
-                "load_ms": load_ms,
-                "transcribe_ms": times_ms,
-                "best_ms": best_ms,
-                "rtf": rtf,
-                "text": text,
-            })
-        );
-    } else {
-        println!(
-            "model={} device={} backend={} audio={:.2}s load={}ms best={}ms rtf={:.2}x",
-            model_id,
-            requested_device,
-            bound_backend.as_deref().unwrap_or("?"),
+        let report = TranscribeFileReport {
+            model: &model_id,
+            requested_device: &requested_device,
+            bound_backend: bound_backend.as_deref(),
             audio_secs,
             load_ms,
+            transcribe_ms: &times_ms,
             best_ms,
             rtf,
-        );
-        println!("text: {}", text);
+            text: &text,
+        };
+        if let Err(e) = serde_json::to_writer(&mut stdout, &report)
+            .map_err(std::io::Error::from)
+            .and_then(|()| writeln!(stdout))
+        {
+            eprintln!("error: failed to write JSON result: {}", e);
+            return 1;
+        }
+    } else if let Err(e) = writeln!(
+        stdout,
+        "model={} device={} backend={} audio={:.2}s load={}ms best={}ms rtf={:.2}x\ntext: {}",
+        model_id,
+        requested_device,
+        bound_backend.as_deref().unwrap_or("?"),
+        audio_secs,
+        load_ms,
+        best_ms,
+        rtf,
+        text,
+    ) {
+        eprintln!("error: failed to write result: {}", e);
+        return 1;
+    }
+    if let Err(e) = stdout.flush() {
+        eprintln!("error: failed to write result: {}", e);
+        return 1;
     }
     0
 }
@@ -646,6 +686,7 @@ pub fn run(cli_args: CliArgs) {
             shortcut::change_append_trailing_space_setting,
             shortcut::change_lazy_stream_close_setting,
             shortcut::change_vad_enabled_setting,
+            shortcut::change_trim_silence_setting,
             shortcut::change_app_language_setting,
             shortcut::change_update_checks_setting,
             shortcut::change_show_whats_new_on_update_setting,
@@ -1,4 +1,5 @@
 use crate::audio_toolkit::{
+    constants::SHORT_CLIP_PAD_SAMPLES,
     list_input_devices,
     vad::{
         SmoothedVad, VAD_OFFLINE_HANGOVER_FRAMES, VAD_ONSET_FRAMES, VAD_PREFILL_FRAMES,
@@ -866,7 +867,7 @@ impl AudioRecordingManager {
                 // debug!("Got {} samples", s_len);
                 if s_len < WHISPER_SAMPLE_RATE && s_len > 0 {
                     let mut padded = samples;
-                    padded.resize(WHISPER_SAMPLE_RATE * 5 / 4, 0.0);
+                    padded.resize(SHORT_CLIP_PAD_SAMPLES, 0.0);
                     Some(padded)
                 } else {
                     Some(samples)
@@ -363,14 +363,17 @@ impl HistoryManager {
             )?;
 
             // Delete WAV file
+            // Unlink directly rather than probing with exists() first: one
+            // syscall per file, and no window for the file to vanish between
+            // the check and the remove.
             let file_path = self.recordings_dir.join(file_name);
-            if file_path.exists() {
-                if let Err(e) = fs::remove_file(&file_path) {
-                    error!("Failed to delete WAV file {}: {}", file_name, e);
-                } else {
+            match fs::remove_file(&file_path) {
+                Ok(()) => {
                     debug!("Deleted old WAV file: {}", file_name);
                     deleted_count += 1;
                 }
+                Err(e) if e.kind() == std::io::ErrorKind::NotFound => {}
+                Err(e) => error!("Failed to delete WAV file {}: {}", file_name, e),
             }
         }
 
@@ -614,11 +617,11 @@ impl HistoryManager {
         if let Some(entry) = self.get_entry_by_id(id).await? {
             // Delete the audio file first
             let file_path = self.get_audio_file_path(&entry.file_name);
-            if file_path.exists() {
-                if let Err(e) = fs::remove_file(&file_path) {
-                    error!("Failed to delete audio file {}: {}", entry.file_name, e);
-                    // Continue with database deletion even if file deletion fails
-                }
+            match fs::remove_file(&file_path) {
+                Ok(()) => {}
+                Err(e) if e.kind() == std::io::ErrorKind::NotFound => {}
+                // Continue with database deletion even if file deletion fails
+                Err(e) => error!("Failed to delete audio file {}: {}", entry.file_name, e),
             }
         }
 
@@ -14,7 +14,7 @@ use std::fs;
 use std::fs::File;
 use std::path::{Path, PathBuf};
 use std::sync::atomic::{AtomicBool, Ordering};
-use std::sync::{Arc, Mutex};
+use std::sync::{Arc, Mutex, OnceLock};
 use std::time::{Duration, Instant};
 use tar::Archive;
 use tauri::{AppHandle, Emitter, Manager};
@@ -310,6 +310,15 @@ pub struct DownloadProgress {
     pub percentage: f64,
 }
 
+static HF_CACHE: OnceLock<Cache> = OnceLock::new();
+
+/// The shared HF cache root, resolved from the environment once per process.
+/// Download-status refreshes look up every catalog file (twice for pinned
+/// revisions), so re-reading HF_HOME and rebuilding the path each time adds up.
+fn hf_cache() -> &'static Cache {
+    HF_CACHE.get_or_init(Cache::from_env)
+}
+
 /// Resolve a Hugging Face model file in the shared HF cache, if already present.
 /// Uses hf-hub's stock location (HF_HOME or ~/.cache/huggingface/hub) so
 /// downloads are shared with other tools.
@@ -321,7 +330,7 @@ pub struct DownloadProgress {
 /// working local model is never invalidated by routine catalog regeneration.
 fn hf_cached_path(repo_id: &str, revision: &str, filename: &str) -> Option<PathBuf> {
     let get = |rev: &str| {
-        Cache::from_env()
+        hf_cache()
             .repo(Repo::with_revision(
                 repo_id.to_string(),
                 RepoType::Model,
@@ -1695,7 +1704,7 @@ impl ModelManager {
     /// transcribe-cpp recognises are surfaced; arbitrary (e.g. LLM) GGUFs that
     /// share the cache are ignored.
     fn discover_hf_cache_models(available_models: &mut HashMap<String, ModelInfo>) {
-        Self::discover_hf_cache_models_in(Cache::from_env().path(), available_models);
+        Self::discover_hf_cache_models_in(hf_cache().path(), available_models);
     }
 
     /// Scan a Hugging Face cache root (`<cache>/models--*`) for GGUF snapshots.
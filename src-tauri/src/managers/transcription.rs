@@ -35,6 +35,8 @@ use transcribe_rs::{
 
 const STREAM_PERF_LOG_INTERVAL: Duration = Duration::from_secs(5);
 const STREAM_FINALIZE_REPLY_TIMEOUT: Duration = Duration::from_secs(30);
+/// One second of 16 kHz silence, run once after a GPU-backed transcribe-cpp load.
+const WARMUP_SAMPLES: usize = 16_000;
 
 fn panic_payload_message(payload: &(dyn std::any::Any + Send)) -> String {
     if let Some(message) = payload.downcast_ref::<&str>() {
@@ -166,11 +168,48 @@ impl StreamRouter {
     }
 }
 
+/// Run-path facts about a loaded transcribe-cpp model. They come from GGUF
+/// metadata and the bound backend, so they cannot change for the life of the
+/// session; they are read once at load instead of on every dictation/stream.
+struct TranscribeCppInfo {
+    backend: String,
+    arch: String,
+    variant: String,
+    takes_initial_prompt: bool,
+    supports_streaming: bool,
+    supports_translate: bool,
+    supports_language_detect: bool,
+    languages: Vec<String>,
+}
+
+impl TranscribeCppInfo {
+    fn probe(session: &Session) -> Self {
+        let model = session.model();
+        let caps = model.capabilities();
+        Self {
+            backend: model.backend().to_string(),
+            arch: model.arch().to_string(),
+            variant: model.variant().to_string(),
+            takes_initial_prompt: model.supports(Feature::InitialPrompt),
+            supports_streaming: caps.supports_streaming,
+            supports_translate: caps.supports_translate,
+            supports_language_detect: caps.supports_language_detect,
+            languages: caps.languages,
+        }
+    }
+
+    /// Whether the model is whisper-family by arch; see `model_is_whisper`
+    /// in `transcribe` for why this is not the InitialPrompt feature.
+    fn is_whisper(&self) -> bool {
+        self.arch == "whisper"
+    }
+}
+
 enum LoadedEngine {
     /// Whisper-family models (whisper, breeze-asr, custom .bin/.gguf) via
     /// transcribe-cpp. Holds the live `Session`, which keeps its `Model` alive
     /// internally, so repeated dictation reuses the session without reloading.
-    TranscribeCpp(Session),
+    TranscribeCpp(Session, TranscribeCppInfo),
     Parakeet(ParakeetModel),
     Moonshine(MoonshineModel),
     MoonshineStreaming(StreamingModel),
@@ -377,6 +416,15 @@ impl TranscriptionManager {
         self.lock_engine().is_some() || self.active_engine_lease.load(Ordering::Acquire) != 0
     }
 
+    /// Whether `model_id` is the engine already held (or leased to the
+    /// streaming worker) and no accelerator change has marked it stale, i.e.
+    /// loading it again would only rebuild what is already resident.
+    pub fn is_model_resident(&self, model_id: &str) -> bool {
+        !self.reload_model_on_next_use.load(Ordering::Acquire)
+            && self.get_current_model().as_deref() == Some(model_id)
+            && self.is_model_loaded()
+    }
+
     /// Accelerator changes should not disturb the current transcription. Mark
     /// the cached engine stale; the next model-use path reloads it with the
     /// latest settings.
@@ -459,7 +507,15 @@ impl TranscriptionManager {
     }
 
     pub fn load_model(&self, model_id: &str) -> Result<()> {
-        self.load_model_with_device(model_id, None)
+        self.load_model_with_device(model_id, None, false)
+    }
+
+    /// Like [`load_model`](Self::load_model), for loads made ahead of use
+    /// (switching models): GPU sessions also get a warm-up run, so the first
+    /// dictation afterwards runs hot. On-demand loads skip it, since a
+    /// transcription is already waiting on them.
+    pub fn preload_model(&self, model_id: &str) -> Result<()> {
+        self.load_model_with_device(model_id, None, true)
     }
 
     /// Like [`load_model`](Self::load_model), but lets a caller hard-select the
@@ -467,12 +523,18 @@ impl TranscriptionManager {
     /// registry index (the index shown by `--list-devices`). `None` keeps the
     /// persisted accelerator setting (which may be Auto). Only affects
     /// transcribe-cpp (whisper-family) models; the selection is not persisted.
+    /// `warm_up` is ignored when unload is set to Immediately: the engine is
+    /// dropped after one transcription, so there is no second run to speed up.
     pub fn load_model_with_device(
         &self,
         model_id: &str,
         device_index: Option<usize>,
+        warm_up: bool,
     ) -> Result<()> {
         apply_accelerator_settings(&self.app_handle);
+        let warm_up = warm_up
+            && get_settings(&self.app_handle).model_unload_timeout
+                != ModelUnloadTimeout::Immediately;
 
         let load_start = std::time::Instant::now();
         debug!("Starting to load model: {}", model_id);
@@ -567,7 +629,7 @@ impl TranscriptionManager {
                 // The bound backend may differ from the request (e.g. CPU
                 // fallback under Auto); log what actually loaded.
                 let bound_backend = model.backend();
-                let session = model.session().map_err(|e| {
+                let mut session = model.session().map_err(|e| {
                     let error_msg = format!(
                         "Failed to create session for whisper model {}: {}",
                         model_id, e
@@ -575,17 +637,29 @@ impl TranscriptionManager {
                     emit_loading_failed(&error_msg);
                     anyhow::anyhow!(error_msg)
                 })?;
+                // GPU backends build their kernels and compute buffers on the
+                // first run. Pay that here, so "loading_completed" means the
+                // next dictation runs hot. CPU has nothing to compile, and a
+                // warm-up there would only add a full encoder pass.
+                if warm_up && !bound_backend.to_string().eq_ignore_ascii_case("cpu") {
+                    warm_up_session(&mut session, model_id).map_err(|e| {
+                        let error_msg =
+                            format!("Failed to warm up whisper model {}: {}", model_id, e);
+                        emit_loading_failed(&error_msg);
+                        anyhow::anyhow!(error_msg)
+                    })?;
+                }
                 // Reconcile the registry's advertised capabilities with the
                 // loaded model's real ones (GGUF metadata) so badges/gating
                 // reflect runtime truth, not the pre-download probe. The
                 // load-completed event below triggers the frontend refresh.
-                let caps = session.model().capabilities();
+                let info = TranscribeCppInfo::probe(&session);
                 self.model_manager.set_runtime_capabilities(
                     model_id,
-                    caps.supports_streaming,
-                    caps.supports_translate,
-                    caps.supports_language_detect,
-                    caps.languages.clone(),
+                    info.supports_streaming,
+                    info.supports_translate,
+                    info.supports_language_detect,
+                    info.languages.clone(),
                 );
                 info!(
                     "Loaded whisper model '{}' (requested {:?}, gpu_device {}, bound backend '{}', \
@@ -594,11 +668,11 @@ impl TranscriptionManager {
                     backend,
                     gpu_device,
                     bound_backend,
-                    caps.supports_streaming,
-                    caps.supports_translate,
-                    caps.supports_language_detect
+                    info.supports_streaming,
+                    info.supports_translate,
+                    info.supports_language_detect
                 );
-                LoadedEngine::TranscribeCpp(session)
+                LoadedEngine::TranscribeCpp(session, info)
             }
             EngineType::Parakeet => {
                 let engine =
@@ -746,9 +820,7 @@ impl TranscriptionManager {
     /// model is loaded.
     pub fn current_backend(&self) -> Option<String> {
         match self.lock_engine().as_ref() {
-            Some(LoadedEngine::TranscribeCpp(session)) => {
-                Some(session.model().backend().to_string())
-            }
+            Some(LoadedEngine::TranscribeCpp(_, info)) => Some(info.backend.clone()),
             Some(_) => Some("onnx".to_string()),
             None => None,
         }
@@ -852,25 +924,19 @@ impl TranscriptionManager {
         // Only transcribe-cpp models expose streaming; ONNX engines fall back to
         // batch. The loaded session (not the ModelManager copy) is the source of
         // truth for run-path capabilities.
-        let (supports_streaming, supports_translate, languages) = match &engine {
-            LoadedEngine::TranscribeCpp(session) => {
-                let model = session.model();
-                let caps = model.capabilities();
+        let supports_streaming = match &engine {
+            LoadedEngine::TranscribeCpp(_, info) => {
                 info!(
                     "Live preview: model '{}' arch='{}' variant='{}' supports_streaming={} \
                      supports_translate={} languages={:?}",
                     model_id,
-                    model.arch(),
-                    model.variant(),
-                    caps.supports_streaming,
-                    caps.supports_translate,
-                    caps.languages,
+                    info.arch,
+                    info.variant,
+                    info.supports_streaming,
+                    info.supports_translate,
+                    info.languages,
                 );
-                (
-                    caps.supports_streaming,
-                    caps.supports_translate,
-                    caps.languages,
-                )
+                info.supports_streaming
             }
             _ => {
                 info!(
@@ -878,7 +944,7 @@ impl TranscriptionManager {
                      streaming is unavailable, using batch transcription",
                     model_id
                 );
-                (false, false, Vec::new())
+                false
             }
         };
 
@@ -889,23 +955,9 @@ impl TranscriptionManager {
             return;
         }
 
-        // Build run options mirroring the offline transcribe-cpp path: task +
-        // language gated against what the model actually advertises.
         let settings = get_settings(&self.app_handle);
         let effective_language =
             effective_language_for_model(&settings, self.model_manager.as_ref(), &model_id);
-        let run_plan = transcribe_cpp_run_plan(
-            settings.translate_to_english,
-            &effective_language,
-            &languages,
-            supports_translate,
-        );
-        let run_options = RunOptions {
-            task: run_plan.task,
-            language: run_plan.language,
-            target_language: run_plan.target_language,
-            ..Default::default()
-        };
 
         // Run the stream on the held session. The Stream borrows the session
         // (and thus the engine) for its lifetime, so the feed/finalize loop
@@ -914,15 +966,25 @@ impl TranscriptionManager {
         let mut finalize_reply: Option<mpsc::Sender<Option<String>>> = None;
         let mut finalize_result: Option<Option<String>> = None;
         let stream_started = 'stream: {
-            let session = match &mut engine {
-                LoadedEngine::TranscribeCpp(s) => s,
+            let (session, info) = match &mut engine {
+                LoadedEngine::TranscribeCpp(s, info) => (s, info),
                 _ => break 'stream false,
             };
 
-            // Read the backend string before beginning the stream — the
-            // `Stream` borrows `session` mutably for its lifetime, so we can't
-            // call `session.model()` once it exists.
-            let backend = session.model().backend();
+            // Build run options mirroring the offline transcribe-cpp path: task +
+            // language gated against what the model actually advertises.
+            let run_plan = transcribe_cpp_run_plan(
+                settings.translate_to_english,
+                &effective_language,
+                &info.languages,
+                info.supports_translate,
+            );
+            let run_options = RunOptions {
+                task: run_plan.task,
+                language: run_plan.language,
+                target_language: run_plan.target_language,
+                ..Default::default()
+            };
 
             // StreamOptions::default() uses CommitPolicy::Auto and lets the
             // family pick its own streaming strategy (no family-specific ext).
@@ -938,13 +1000,29 @@ impl TranscriptionManager {
             self.touch_activity();
             info!(
                 "Live streaming transcription started (model '{}', backend '{}')",
-                model_id, backend
+                model_id, info.backend
             );
 
             let mut perf = StreamPerf::new();
-            while let Ok(cmd) = rx.recv() {
+            // A non-Feed command pulled off the queue while batching frames;
+            // handled next so Finalize/Cancel keep their place in line.
+            let mut pending: Option<StreamCmd> = None;
+            let mut feed_failures: u64 = 0;
+            while let Some(cmd) = pending.take().or_else(|| rx.recv().ok()) {
                 match cmd {
-                    StreamCmd::Feed(pcm) => {
+                    StreamCmd::Feed(mut pcm) => {
+                        // Frames that queued up while the previous feed was
+                        // computing go in as one batch: one native call and at
+                        // most one text emit, instead of one per 30 ms frame.
+                        while let Ok(next) = rx.try_recv() {
+                            match next {
+                                StreamCmd::Feed(more) => pcm.extend_from_slice(&more),
+                                other => {
+                                    pending = Some(other);
+                                    break;
+                                }
+                            }
+                        }
                         self.touch_activity();
                         perf.record_feed(pcm.len());
                         let feed_start = Instant::now();
@@ -966,7 +1044,15 @@ impl TranscriptionManager {
                             }
                             Err(e) => {
                                 perf.record_compute(feed_start.elapsed());
-                                warn!("stream feed failed: {}", e);
+                                // A stream that breaks tends to fail every
+                                // frame after; warn once, keep the rest at
+                                // debug, and summarise when the stream ends.
+                                feed_failures += 1;
+                                if feed_failures == 1 {
+                                    warn!("stream feed failed: {}", e);
+                                } else {
+                                    debug!("stream feed failed ({}): {}", feed_failures, e);
+                                }
                             }
                         }
                     }
@@ -1009,6 +1095,9 @@ impl TranscriptionManager {
                     }
                 }
             }
+            if feed_failures > 1 {
+                warn!("{} stream feeds failed during this session", feed_failures);
+            }
 
             true
         };
@@ -1109,7 +1198,7 @@ impl TranscriptionManager {
         .emit(&self.app_handle);
     }
 
-    pub fn transcribe(&self, audio: Vec<f32>) -> Result<String> {
+    pub fn transcribe(&self, audio: &[f32]) -> Result<String> {
         #[cfg(debug_assertions)]
         if std::env::var("HANDY_FORCE_TRANSCRIPTION_FAILURE").is_ok() {
             return Err(anyhow::anyhow!(
@@ -1204,33 +1293,27 @@ impl TranscriptionManager {
             // Release the lock before transcribing — no mutex held during the engine call
             drop(engine_guard);
 
-            // Probe live transcribe-cpp capabilities once (cheap GGUF-metadata
-            // reads); the loaded session is the source of truth, not the
+            // Live transcribe-cpp capabilities, probed from the loaded session
+            // at load time; the session is the source of truth, not the
             // ModelManager copy. The whisper run extension is kind-tagged, so
             // non-whisper archs (parakeet, voxtral, …) reject it with
             // INVALID_ARG; attach it — and translate — only where supported.
-            let mut model_supports_translate = false;
-            let mut model_languages: Vec<String> = Vec::new();
-            if let LoadedEngine::TranscribeCpp(session) = &engine {
-                let model = session.model();
-                let caps = model.capabilities();
-                model_takes_initial_prompt = model.supports(Feature::InitialPrompt);
-                model_is_whisper = model.arch() == "whisper";
-                model_supports_translate = caps.supports_translate;
-                model_languages = caps.languages;
+            if let LoadedEngine::TranscribeCpp(_, info) = &engine {
+                model_takes_initial_prompt = info.takes_initial_prompt;
+                model_is_whisper = info.is_whisper();
                 debug!(
                     "transcribe-cpp model '{}' on '{}': initial_prompt={}, translate={}, languages={:?}",
                     settings.selected_model,
-                    model.backend(),
+                    info.backend,
                     model_takes_initial_prompt,
-                    model_supports_translate,
-                    model_languages
+                    info.supports_translate,
+                    info.languages
                 );
             }
 
             let transcribe_result = catch_unwind(AssertUnwindSafe(|| -> Result<String> {
                 match &mut engine {
-                    LoadedEngine::TranscribeCpp(session) => {
+                    LoadedEngine::TranscribeCpp(session, info) => {
                         // Custom words become the initial prompt ONLY for models
                         // that accept one (whisper family). Attaching the
                         // whisper run extension to a non-whisper arch is rejected
@@ -1248,8 +1331,8 @@ impl TranscriptionManager {
                         let run_plan = transcribe_cpp_run_plan(
                             settings.translate_to_english,
                             &validated_language,
-                            &model_languages,
-                            model_supports_translate,
+                            &info.languages,
+                            info.supports_translate,
                         );
 
                         let run_options = RunOptions {
@@ -1268,7 +1351,7 @@ impl TranscriptionManager {
                         );
 
                         session
-                            .run(&audio, &run_options)
+                            .run(audio, &run_options)
                             .map(|t| t.text)
                             .map_err(|e| {
                                 anyhow::anyhow!("transcribe-cpp transcription failed: {}", e)
@@ -1280,16 +1363,16 @@ impl TranscriptionManager {
                             ..Default::default()
                         };
                         parakeet_engine
-                            .transcribe_with(&audio, &params)
+                            .transcribe_with(audio, &params)
                             .map(|r| r.text)
                             .map_err(|e| anyhow::anyhow!("Parakeet transcription failed: {}", e))
                     }
                     LoadedEngine::Moonshine(moonshine_engine) => moonshine_engine
-                        .transcribe(&audio, &TranscribeOptions::default())
+                        .transcribe(audio, &TranscribeOptions::default())
                         .map(|r| r.text)
                         .map_err(|e| anyhow::anyhow!("Moonshine transcription failed: {}", e)),
                     LoadedEngine::MoonshineStreaming(streaming_engine) => streaming_engine
-                        .transcribe(&audio, &TranscribeOptions::default())
+                        .transcribe(audio, &TranscribeOptions::default())
                         .map(|r| r.text)
                         .map_err(|e| {
                             anyhow::anyhow!("Moonshine streaming transcription failed: {}", e)
@@ -1308,12 +1391,12 @@ impl TranscriptionManager {
                             use_itn: Some(true),
                         };
                         sense_voice_engine
-                            .transcribe_with(&audio, &params)
+                            .transcribe_with(audio, &params)
                             .map(|r| r.text)
                             .map_err(|e| anyhow::anyhow!("SenseVoice transcription failed: {}", e))
                     }
                     LoadedEngine::GigaAM(gigaam_engine) => gigaam_engine
-                        .transcribe(&audio, &TranscribeOptions::default())
+                        .transcribe(audio, &TranscribeOptions::default())
                         .map(|r| r.text)
                         .map_err(|e| anyhow::anyhow!("GigaAM transcription failed: {}", e)),
                     LoadedEngine::Canary(canary_engine) => {
@@ -1328,7 +1411,7 @@ impl TranscriptionManager {
                             ..Default::default()
                         };
                         canary_engine
-                            .transcribe(&audio, &options)
+                            .transcribe(audio, &options)
                             .map(|r| r.text)
                             .map_err(|e| anyhow::anyhow!("Canary transcription failed: {}", e))
                     }
@@ -1343,7 +1426,7 @@ impl TranscriptionManager {
                             ..Default::default()
                         };
                         cohere_engine
-                            .transcribe(&audio, &options)
+                            .transcribe(audio, &options)
                             .map(|r| r.text)
                             .map_err(|e| anyhow::anyhow!("Cohere transcription failed: {}", e))
                     }
@@ -1691,6 +1774,32 @@ fn drain_until_finalize(rx: mpsc::Receiver<StreamCmd>) {
     }
 }
 
+/// Run a short silent transcription on a freshly loaded session so the first
+/// real dictation doesn't pay for kernel compilation and buffer allocation.
+/// A failed run is only logged — the model itself loaded fine — but a panic
+/// leaves the native session in an unknown state, so it fails the load.
+fn warm_up_session(session: &mut Session, model_id: &str) -> Result<()> {
+    let start = Instant::now();
+    let silence = vec![0.0f32; WARMUP_SAMPLES];
+    match catch_unwind(AssertUnwindSafe(|| {
+        session.run(&silence, &RunOptions::default())
+    })) {
+        Ok(Ok(_)) => debug!(
+            "Warmed up model '{}' in {}ms",
+            model_id,
+            start.elapsed().as_millis()
+        ),
+        Ok(Err(e)) => warn!("Warm-up run for model '{}' failed: {}", model_id, e),
+        Err(payload) => {
+            return Err(anyhow::anyhow!(
+                "warm-up run panicked: {}",
+                panic_payload_message(payload.as_ref())
+            ))
+        }
+    }
+    Ok(())
+}
+
 /// Initialize the transcribe-cpp native backend once at startup: route native +
 /// ggml diagnostics into the `log` facade and register compute backend modules.
 /// In a static build (macOS Metal) `init_backends_default` is a harmless no-op;
@@ -468,6 +468,10 @@ pub struct AppSettings {
     pub extra_recording_buffer_ms: u64,
     #[serde(default = "default_vad_enabled")]
     pub vad_enabled: bool,
+    /// Cut silent edges off VAD-off recordings before batch transcription.
+    /// Off by default: it is an energy gate, and can clip a quiet onset.
+    #[serde(default)]
+    pub trim_silence: bool,
     /// Which recording overlay to show: None / Minimal / Live. Streaming mode is
     /// not gated on this — that follows model capability. Migrated from the old
     /// `overlay_position` (position `none` → style `None`).
@@ -904,6 +908,7 @@ pub fn get_default_settings() -> AppSettings {
         transcribe_gpu_device: default_transcribe_gpu_device(),
         extra_recording_buffer_ms: 0,
         vad_enabled: default_vad_enabled(),
+        trim_silence: false,
         overlay_style: default_overlay_style(),
     }
 }
@@ -954,14 +959,15 @@ pub fn get_settings(app: &AppHandle) -> AppSettings {
     // Settings reads also persist one-time migrations. Migration helpers are
     // idempotent, so this converges after the first read of an older store.
     let mut settings = if let Some(settings_value) = store.get("settings") {
-        let (mut settings, mut updated) =
-            match serde_json::from_value::<AppSettings>(settings_value.clone()) {
-                Ok(settings) => (settings, false),
-                Err(e) => {
-                    warn!("Failed to parse stored settings ({e}); salvaging valid fields");
-                    (salvage_settings(&settings_value), true)
-                }
-            };
+        // Deserialize from the borrowed Value; from_value would need an owned
+        // deep copy of the whole settings tree on every read.
+        let (mut settings, mut updated) = match AppSettings::deserialize(&settings_value) {
+            Ok(settings) => (settings, false),
+            Err(e) => {
+                warn!("Failed to parse stored settings ({e}); salvaging valid fields");
+                (salvage_settings(&settings_value), true)
+            }
+        };
 
         if apply_settings_migrations(&mut settings, &settings_value) {
             updated = true;
@@ -1013,7 +1019,7 @@ fn salvage_settings(stored: &serde_json::Value) -> AppSettings {
             .as_object_mut()
             .expect("merged settings stay an object")
             .insert(key.clone(), value.clone());
-        if serde_json::from_value::<AppSettings>(merged.clone()).is_err() {
+        if AppSettings::deserialize(&merged).is_err() {
             // Log only the key: values may hold secrets (e.g. API keys).
             warn!("Dropping invalid settings field '{key}', keeping its default");
             let map = merged
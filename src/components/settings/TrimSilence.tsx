@@ -0,0 +1,30 @@
+import React from "react";
+import { useTranslation } from "react-i18next";
+import { ToggleSwitch } from "../ui/ToggleSwitch";
+import { useSettings } from "../../hooks/useSettings";
+
+interface TrimSilenceProps {
+  descriptionMode?: "tooltip" | "inline";
+  grouped?: boolean;
+}
+
+export const TrimSilence: React.FC<TrimSilenceProps> = ({
+  descriptionMode = "tooltip",
+  grouped = false,
+}) => {
+  const { t } = useTranslation();
+  const { getSetting, updateSetting, isUpdating } = useSettings();
+  const enabled = getSetting("trim_silence") ?? false;
+
+  return (
+    <ToggleSwitch
+      checked={enabled}
+      onChange={(enabled) => updateSetting("trim_silence", enabled)}
+      isUpdating={isUpdating("trim_silence")}
+      label={t("settings.advanced.trimSilence.title")}
+      description={t("settings.advanced.trimSilence.description")}
+      descriptionMode={descriptionMode}
+      grouped={grouped}
+    />
+  );
+};